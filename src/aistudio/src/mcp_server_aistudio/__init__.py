@@ -4,8 +4,17 @@ AI Studio MCP Server
 A Model Context Protocol server for Google AI Studio automation.
 """
 
-# Import main from server module - it's a regular function, not async
-from .server import main
-
 __version__ = "0.1.0"
 __all__ = ["main"]
+
+
+def main():
+    """Run the MCP server.
+
+    The server module (and with it mcp and playwright) is imported here rather
+    than at package import, so importing e.g. mcp_server_aistudio.config stays
+    cheap.
+    """
+    from .server import main as run_server
+
+    run_server()
@@ -12,29 +12,387 @@ Timing: Critical patterns from llms-aistudio-04-browser-automation-reference.md
 """
 
 import asyncio
+import json
 import logging
-import subprocess
+import re
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Tuple, Any
+from typing import AsyncIterator, Mapping, Optional, Dict, Tuple, Any, cast
 
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright, StorageState
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError, expect
 
 from .config import (
     STORAGE_STATE_PATH,
-    GEMINI_IMPLEMENTATION_WAIT,
-    DIALOG_LOAD_WAIT,
-    VERIFICATION_RETRY_WAIT,
-    NAVIGATION_WAIT,
+    ensure_storage_dir,
+    AUTH_MAX_AGE,
+    HEADLESS,
+    BROWSER_ARGS,
+    CDP_ENDPOINT,
+    USER_DATA_DIR,
+    MAX_CONCURRENCY,
+    SESSION_IDLE_TTL,
+    DIALOG_LOAD_TIMEOUT,
+    GENERATION_START_TIMEOUT,
+    REPO_CREATION_TIMEOUT,
+    COMMIT_TIMEOUT,
+    DEPLOYMENT_TIMEOUT,
 )
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# Deployed Cloud Run URL (https://[name].run.app)
+_RUN_APP_URL_RE = re.compile(r'https://[a-zA-Z0-9\-]+\.run\.app/?')
+
+# Accessible names for role-based locators in the GitHub/Deploy dialogs
+_SAVE_TO_GITHUB_RE = re.compile(r"Save to GitHub")
+_STAGE_AND_COMMIT_RE = re.compile(r"Stage and commit all changes")
+_CREATE_REPO_RE = re.compile(r"Create Git repo")
+_COMMIT_MESSAGE_RE = re.compile(r"[Cc]ommit message")
+_REDEPLOY_RE = re.compile(r"Redeploy")
+_INTERNAL_ERROR_RE = re.compile(r"An internal error occurred")
+_DEPLOY_FAILED_RE = re.compile(r"Deployment failed|Failed to deploy")
+
+
+class _BrowserPool:
+    """
+    Process-wide Playwright driver and Chromium browser shared by all tool calls.
+
+    Starting the Node driver and launching a browser dominate the cost of each
+    tool invocation, while contexts are cheap. The pool starts both lazily on
+    first use and keeps them alive; callers only open and close their own
+    BrowserContext. With CDP_ENDPOINT set, the pool attaches to an external
+    browser instead, so even the first call skips the launch.
+    """
+
+    def __init__(self):
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._persistent: Optional[BrowserContext] = None
+        # mtime of the storage state last imported into _persistent
+        self._cookies_mtime_ns: Optional[int] = None
+        self._lock = asyncio.Lock()
+
+    async def _ensure_playwright(self) -> Playwright:
+        # Caller must hold self._lock
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+            logger.info("Started Playwright driver")
+        return self._playwright
+
+    async def get_playwright(self) -> Playwright:
+        """Return the shared Playwright driver, starting it on first use."""
+        async with self._lock:
+            return await self._ensure_playwright()
+
+    async def get_browser(self) -> Browser:
+        """Return the shared browser, launching it on first use."""
+        async with self._lock:
+            if self._browser is None or not self._browser.is_connected():
+                playwright = await self._ensure_playwright()
+                if CDP_ENDPOINT:
+                    self._browser = await playwright.chromium.connect_over_cdp(CDP_ENDPOINT)
+                    logger.info(f"Connected to Chromium over CDP: {CDP_ENDPOINT}")
+                else:
+                    self._browser = await playwright.chromium.launch(
+                        headless=HEADLESS, args=BROWSER_ARGS
+                    )
+                    logger.info(f"Launched shared Chromium browser (headless={HEADLESS})")
+            return self._browser
+
+    async def get_persistent_context(self) -> BrowserContext:
+        """
+        Return the shared USER_DATA_DIR context, launching it on first use.
+
+        Cookies from STORAGE_STATE_PATH are imported on launch and again
+        whenever the file changes, so a later aistudio_login takes effect
+        without restarting the server.
+        """
+        async with self._lock:
+            if self._persistent is None:
+                playwright = await self._ensure_playwright()
+                context = await playwright.chromium.launch_persistent_context(
+                    str(USER_DATA_DIR), headless=HEADLESS, args=BROWSER_ARGS
+                )
+                context.on("close", lambda _: setattr(self, "_persistent", None))
+                self._persistent = context
+                self._cookies_mtime_ns = None
+                logger.info(f"Launched persistent browser profile: {USER_DATA_DIR}")
+            try:
+                mtime_ns = STORAGE_STATE_PATH.stat().st_mtime_ns
+            except FileNotFoundError:
+                mtime_ns = None
+            if mtime_ns is not None and mtime_ns != self._cookies_mtime_ns:
+                await self._persistent.add_cookies(_load_storage_state().get("cookies", []))
+                self._cookies_mtime_ns = mtime_ns
+                logger.info(f"Imported cookies from {STORAGE_STATE_PATH}")
+            return self._persistent
+
+    async def close(self):
+        """Close the shared browser and stop the Playwright driver."""
+        async with self._lock:
+            if self._persistent is not None:
+                await self._persistent.close()
+                self._persistent = None
+            if self._browser is not None:
+                await self._browser.close()
+                self._browser = None
+                logger.info("Closed shared browser")
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+
+_pool = _BrowserPool()
+_context_slots = asyncio.Semaphore(MAX_CONCURRENCY)
+
+
+async def get_playwright() -> Playwright:
+    """Return the process-wide Playwright driver."""
+    return await _pool.get_playwright()
+
+
+async def get_browser() -> Browser:
+    """Return the process-wide shared browser."""
+    return await _pool.get_browser()
+
+
+_storage_state_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+
+
+def _load_storage_state() -> Dict[str, Any]:
+    """Parsed STORAGE_STATE_PATH, re-read only when the file changes."""
+    global _storage_state_cache
+    mtime_ns = STORAGE_STATE_PATH.stat().st_mtime_ns
+    if _storage_state_cache is None or _storage_state_cache[0] != mtime_ns:
+        state = json.loads(STORAGE_STATE_PATH.read_text(encoding="utf-8"))
+        _storage_state_cache = (mtime_ns, state)
+    return _storage_state_cache[1]
+
+
+# Google's sign-in cookies; the rest of the saved state is short-lived
+# tracking/consent cookies whose expiry says nothing about the login
+_AUTH_COOKIE_RE = re.compile(r"^(SID|__Secure-\w*PSID)$")
+
+
+def saved_auth_is_fresh(max_age: int = AUTH_MAX_AGE) -> bool:
+    """Return True if STORAGE_STATE_PATH holds a login saved less than max_age seconds ago."""
+    try:
+        st = STORAGE_STATE_PATH.stat()
+        if st.st_size == 0 or time.time() - st.st_mtime >= max_age:
+            return False
+        state = _load_storage_state()
+    except (OSError, ValueError):
+        return False
+    cookies = state.get("cookies") if isinstance(state, dict) else None
+    if not isinstance(cookies, list) or not cookies:
+        return False
+    now = time.time()
+    # Session cookies carry expires == -1
+    return all(
+        cookie.get("expires", -1) <= 0 or cookie["expires"] > now
+        for cookie in cookies
+        if _AUTH_COOKIE_RE.match(cookie.get("name", ""))
+    )
+
+
+def _save_storage_state(path: Path, state: Mapping[str, Any]) -> bool:
+    """Atomically write storage state unless the file already holds it."""
+    try:
+        if json.loads(path.read_text(encoding="utf-8")) == state:
+            path.touch()  # Keep mtime as the last successful login time
+            return False
+    except (FileNotFoundError, ValueError):
+        pass
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_text(json.dumps(state, indent=2), encoding="utf-8")
+    tmp_path.replace(path)
+    return True
+
+
+async def _log_heartbeat(message: str, start_time: float, interval: int = 30):
+    """Log progress every interval seconds until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        elapsed = time.monotonic() - start_time
+        logger.info(f"{message} ({elapsed:.0f}s elapsed)")
+
+
+async def _open_page() -> Page:
+    """Open an authenticated page: a tab in USER_DATA_DIR, else a fresh context."""
+    if USER_DATA_DIR:
+        context = await _pool.get_persistent_context()
+    else:
+        browser = await get_browser()
+        context = await browser.new_context(storage_state=cast(StorageState, _load_storage_state()))
+    return await context.new_page()
+
+
+async def _close_page(page: Page):
+    """Close a page from _open_page (and its context unless it is the shared profile)."""
+    if USER_DATA_DIR:
+        await page.close()
+    else:
+        await page.context.close()
+
+
+async def _acquire_slot():
+    """Take one of the MAX_CONCURRENCY browser slots, waiting if all are busy."""
+    if _context_slots.locked():
+        logger.info(f"All {MAX_CONCURRENCY} browser slots busy, waiting...")
+    await _context_slots.acquire()
+
+
+class _Session:
+    """A cached page, the browser slot it holds and the lock serializing its users."""
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.lock = asyncio.Lock()
+        self.last_used = time.monotonic()
+
+    async def close(self):
+        """Close the page and give its browser slot back."""
+        try:
+            if not self.page.is_closed():
+                await _close_page(self.page)
+        finally:
+            _context_slots.release()
+
+
+class _SessionCache:
+    """
+    Authenticated pages kept open between related tool calls.
+
+    A client that passes the same session_id to create_repo, commit_and_deploy
+    and wait_for_implementation reuses one page instead of reloading the auth
+    state and re-navigating to the app for every step. Each open session holds
+    one of the MAX_CONCURRENCY browser slots until it is closed, and calls
+    sharing a session_id take turns on its page. Sessions idle for more than
+    SESSION_IDLE_TTL seconds are closed on the next cache access.
+    """
+
+    def __init__(self):
+        self._sessions: Dict[str, _Session] = {}
+        self._lock = asyncio.Lock()
+
+    async def _evict_idle(self):
+        # Caller must hold self._lock
+        now = time.monotonic()
+        for session_id, session in list(self._sessions.items()):
+            if session.lock.locked() or now - session.last_used <= SESSION_IDLE_TTL:
+                continue
+            del self._sessions[session_id]
+            await session.close()
+            logger.info(f"Closed idle session: {session_id}")
+
+    async def _get_session(self, session_id: str) -> _Session:
+        """Return the live session for session_id, opening it on first use."""
+        async with self._lock:
+            await self._evict_idle()
+            session = self._sessions.get(session_id)
+            if session is not None:
+                if not session.page.is_closed():
+                    logger.info(f"Reusing session: {session_id}")
+                    return session
+                # Page died under us (e.g. browser restart); free its slot
+                del self._sessions[session_id]
+                await session.close()
+
+        # Wait for a slot without holding the cache lock, so other sessions
+        # stay usable meanwhile
+        await _acquire_slot()
+        try:
+            page = await _open_page()
+        except BaseException:
+            _context_slots.release()
+            raise
+        session = _Session(page)
+
+        async with self._lock:
+            existing = self._sessions.get(session_id)
+            if existing is not None and not existing.page.is_closed():
+                # A concurrent call opened the same session first
+                await session.close()
+                return existing
+            self._sessions[session_id] = session
+        logger.info(f"Opened session: {session_id}")
+        return session
+
+    @asynccontextmanager
+    async def use(self, session_id: str, app_url: str) -> AsyncIterator[Page]:
+        """Hold the session's page on app_url for one tool call."""
+        session = await self._get_session(session_id)
+        async with session.lock:
+            session.last_used = time.monotonic()
+            try:
+                if session.page.url != app_url:
+                    await session.page.goto(app_url)
+                yield session.page
+            finally:
+                session.last_used = time.monotonic()
+
+    async def close(self, session_id: str) -> bool:
+        """Close one session; returns False if it was not open."""
+        async with self._lock:
+            session = self._sessions.pop(session_id, None)
+        if session is None:
+            return False
+        # Let a call that is using the page finish first
+        async with session.lock:
+            await session.close()
+        logger.info(f"Closed session: {session_id}")
+        return True
+
+    async def close_all(self):
+        """Close every open session."""
+        async with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            await session.close()
+
+
+_sessions = _SessionCache()
+
+
+@asynccontextmanager
+async def app_page(app_url: str, session_id: Optional[str] = None) -> AsyncIterator[Page]:
+    """
+    Yield a page on app_url for one tool call.
+
+    With a session_id the page comes from (and stays in) the session cache;
+    without one a page is opened and closed around the call. Either way the
+    page holds one of the MAX_CONCURRENCY browser slots while it is open.
+    """
+    if session_id:
+        async with _sessions.use(session_id, app_url) as page:
+            yield page
+        return
+    await _acquire_slot()
+    try:
+        page = await _open_page()
+        try:
+            await page.goto(app_url)
+            yield page
+        finally:
+            await _close_page(page)
+    finally:
+        _context_slots.release()
+
+
+async def close_session(session_id: str) -> bool:
+    """Close a cached workflow session."""
+    return await _sessions.close(session_id)
+
+
+async def shutdown_browser():
+    """Release sessions, the shared browser and driver; call once on server shutdown."""
+    await _sessions.close_all()
+    await _pool.close()
+
 
 class AIStudioAutomation:
     """
@@ -64,7 +422,7 @@ class AIStudioAutomation:
             Tuple[BrowserContext, Page]: Authenticated context and page
 
         Process:
-        1. Launch browser
+        1. Launch a visible browser on the shared Playwright driver
         2. Create new context
         3. Navigate to AI Studio
         4. Wait for user to authenticate
@@ -72,26 +430,35 @@ class AIStudioAutomation:
         """
         logger.info("Starting AI Studio authentication...")
 
-        async with async_playwright() as p:
-            self.browser = await p.chromium.launch(headless=False)
-            self.context = await self.browser.new_context()
-            self.page = await self.context.new_page()
+        playwright = await get_playwright()
+        self.browser = await playwright.chromium.launch(headless=False)
+        self.context = await self.browser.new_context()
+        self.page = await self.context.new_page()
 
-            # Navigate to AI Studio
-            await self.page.goto("https://aistudio.google.com/apps?source=start")
-            logger.info("Navigate to AI Studio start page. Please authenticate if needed.")
+        # Navigate to AI Studio
+        await self.page.goto("https://aistudio.google.com/apps?source=start")
+        logger.info("Navigate to AI Studio start page. Please authenticate if needed.")
 
-            # Wait for user to authenticate and navigate to a project
-            # Typically: user signs in, AI Studio loads
-            await self.page.wait_for_load_state("networkidle", timeout=30000)
+        # Wait for user to authenticate and navigate to a project
+        # Typically: user signs in, AI Studio loads
+        await self.page.wait_for_load_state("networkidle", timeout=30000)
 
-            # Save authentication state for reuse
-            await self.context.storage_state(path=str(self.storage_state_path))
+        # Save authentication state for reuse (skipped when nothing changed)
+        state = await self.context.storage_state()
+        ensure_storage_dir()
+        if _save_storage_state(self.storage_state_path, state):
             logger.info(f"Authentication successful. State saved to {self.storage_state_path}")
+        else:
+            logger.info(f"Authentication successful. State unchanged at {self.storage_state_path}")
 
-            return self.context, self.page
+        return self.context, self.page
 
-    async def open_github_panel(self, context: BrowserContext, app_url: str) -> Page:
+    async def open_github_panel(
+        self,
+        context: BrowserContext,
+        app_url: str,
+        page: Optional[Page] = None
+    ) -> Page:
         """
         Navigate to AI Studio app and click 'Save to GitHub' button.
 
@@ -99,36 +466,30 @@ class AIStudioAutomation:
             context: Authenticated Playwright context
             app_url: Full URL to AI Studio project (e.g.,
                     https://aistudio.google.com/apps/drive/[PROJECT-ID]?source=start)
+            page: Page already showing app_url; a new page is opened if omitted
 
         Returns:
             Page: Page object with GitHub panel visible
 
         Timing:
-        - Navigation wait: 3 seconds
-        - Dialog load wait: 8-10 seconds
+        - Waits for the button and dialog to become visible (up to
+          DIALOG_LOAD_TIMEOUT seconds each) instead of fixed sleeps
         """
         logger.info(f"Opening GitHub panel for app: {app_url}")
 
-        page = await context.new_page()
-        await page.goto(app_url)
-        await asyncio.sleep(NAVIGATION_WAIT)
+        if page is None:
+            page = await context.new_page()
+            await page.goto(app_url)
 
-        # Click "Save to GitHub" button
-        save_to_github_btn = page.locator('button', has_text="Save to GitHub")
+        # Click "Save to GitHub" button as soon as it is rendered
+        save_to_github_btn = page.get_by_role("button", name=_SAVE_TO_GITHUB_RE)
+        await save_to_github_btn.wait_for(state="visible", timeout=DIALOG_LOAD_TIMEOUT * 1000)
         await save_to_github_btn.click()
         logger.info("Clicked 'Save to GitHub' button")
 
         # Wait for GitHub panel to fully load
-        logger.info(f"Waiting {DIALOG_LOAD_WAIT} seconds for GitHub dialog to render...")
-        await asyncio.sleep(DIALOG_LOAD_WAIT)
-
-        # Verify GitHub dialog is ready
-        stage_commit_btn = page.locator('button', has_text="Stage and commit all changes")
-        is_ready = await stage_commit_btn.is_visible()
-
-        if not is_ready:
-            logger.warning("GitHub dialog not fully loaded, waiting additional time...")
-            await asyncio.sleep(VERIFICATION_RETRY_WAIT)
+        stage_commit_btn = page.get_by_role("button", name=_STAGE_AND_COMMIT_RE)
+        await expect(stage_commit_btn).to_be_visible(timeout=DIALOG_LOAD_TIMEOUT * 1000)
 
         logger.info("GitHub panel ready")
         return page
@@ -157,7 +518,7 @@ class AIStudioAutomation:
         2. Fill description field
         3. Set visibility (private/public)
         4. Click "Create Git repo" button
-        5. Wait 5-10 seconds for repository creation
+        5. Wait for the commit message prompt (up to REPO_CREATION_TIMEOUT seconds)
         """
         logger.info(f"Creating GitHub repository: {repo_name}")
 
@@ -180,18 +541,18 @@ class AIStudioAutomation:
                 logger.info("Set visibility to Private")
 
             # Click "Create Git repo" button
-            create_repo_btn = page.locator('button', has_text="Create Git repo")
+            create_repo_btn = page.get_by_role("button", name=_CREATE_REPO_RE)
             await create_repo_btn.click()
             logger.info("Clicked 'Create Git repo' button")
 
-            # Wait for repository creation to complete
-            logger.info(f"Waiting {VERIFICATION_RETRY_WAIT * 2} seconds for repo creation...")
-            await asyncio.sleep(VERIFICATION_RETRY_WAIT * 2)
-
             # Verify repository was created (look for success indicator or next step)
             # In AI Studio, after repo creation, should see commit message prompt
-            commit_label = page.locator('text=Commit message').first
-            is_ready = await commit_label.is_visible()
+            commit_label = page.get_by_text(_COMMIT_MESSAGE_RE).first
+            try:
+                await expect(commit_label).to_be_visible(timeout=REPO_CREATION_TIMEOUT * 1000)
+                is_ready = True
+            except AssertionError:
+                is_ready = False
 
             return {
                 "status": "success" if is_ready else "pending",
@@ -226,34 +587,29 @@ class AIStudioAutomation:
             Dict: Status of commit operation
 
         Process:
-        1. Wait for commit message prompt to appear
-        2. Fill commit message textarea
-        3. Click "Stage and commit all changes" button
-        4. Wait for commit completion
+        1. Fill the "Commit message" textbox (fill() auto-waits until it is editable)
+        2. Click "Stage and commit all changes" button
+        3. Wait for the stage-and-commit button to clear (up to COMMIT_TIMEOUT seconds)
         """
         logger.info(f"Committing to GitHub with message: {commit_message[:50]}...")
 
         try:
             # Fill commit message
-            # The message field may be a textarea in the GitHub panel
-            commit_input = page.locator('textarea').first
+            # The message field is the textbox labelled "Commit message" in the GitHub panel
+            commit_input = page.get_by_role("textbox", name=_COMMIT_MESSAGE_RE)
             await commit_input.fill(commit_message)
             logger.info("Filled commit message")
 
             # Click "Stage and commit all changes" button
-            stage_commit_btn = page.locator('button', has_text="Stage and commit all changes")
+            stage_commit_btn = page.get_by_role("button", name=_STAGE_AND_COMMIT_RE)
             await stage_commit_btn.click()
             logger.info("Clicked 'Stage and commit all changes' button")
 
-            # Wait for commit to process
-            await asyncio.sleep(VERIFICATION_RETRY_WAIT)
-
-            # Look for completion indicator (commit dialog disappears or success message)
+            # Commit is done once the stage-and-commit button goes away
             try:
-                # Wait for the dialog to close or change state
-                await page.wait_for_load_state("networkidle", timeout=10000)
-            except:
-                pass  # May timeout but that's okay, we'll check manually
+                await expect(stage_commit_btn).to_be_hidden(timeout=COMMIT_TIMEOUT * 1000)
+            except AssertionError:
+                logger.warning(f"Commit dialog still open after {COMMIT_TIMEOUT}s")
 
             logger.info("Commit completed")
 
@@ -292,63 +648,125 @@ class AIStudioAutomation:
         3. Wait for deploy dialog to load
         4. Select Google Cloud project
         5. Click deploy button
-        6. Wait for deployment to complete
+        6. Wait for deployment to complete (for a redeploy: the Redeploy
+           button is disabled while it runs and re-enabled when it is done)
         7. Capture deployed URL
         """
         logger.info(f"Deploying application to Google Cloud project: {google_cloud_project}")
 
         try:
-            # Close GitHub dialog
+            # Probe GitHub dialog and "Deploy app" button in one batch
             close_btn = page.locator('button[aria-label*="Close"]').first
-            if await close_btn.is_visible():
+            deploy_btn = page.get_by_role("button", name="Deploy app", exact=True)
+            close_visible, deploy_visible = await asyncio.gather(
+                close_btn.is_visible(), deploy_btn.is_visible()
+            )
+
+            # Close GitHub dialog
+            if close_visible:
                 await close_btn.click()
                 logger.info("Closed GitHub dialog")
 
-            await asyncio.sleep(VERIFICATION_RETRY_WAIT)
-
-            # Click "Deploy app" button
-            deploy_btn = page.locator('button[aria-label="Deploy app"]')
+            # Click "Deploy app" button once it is actionable
+            if not deploy_visible:
+                await expect(deploy_btn).to_be_visible(timeout=DIALOG_LOAD_TIMEOUT * 1000)
             await deploy_btn.click()
             logger.info("Clicked 'Deploy app' button")
 
-            # Wait for deploy dialog to load
-            logger.info(f"Waiting {DIALOG_LOAD_WAIT} seconds for deploy dialog...")
-            await asyncio.sleep(DIALOG_LOAD_WAIT)
+            # Wait for deploy dialog to load (project selector or redeploy button)
+            project_selector = page.locator('[role="combobox"]').first
+            redeploy_btn = page.get_by_role("button", name=_REDEPLOY_RE).first
+            try:
+                await expect(project_selector.or_(redeploy_btn).first).to_be_visible(
+                    timeout=DIALOG_LOAD_TIMEOUT * 1000
+                )
+            except AssertionError:
+                logger.warning("Deploy dialog did not render within timeout")
+
+            selector_visible, redeploy_visible = await asyncio.gather(
+                project_selector.is_visible(), redeploy_btn.is_visible()
+            )
 
             # Select Google Cloud project from dropdown
-            project_selector = page.locator('[role="combobox"]').first
-            if await project_selector.is_visible():
+            if selector_visible:
                 await project_selector.click()
-                await asyncio.sleep(1)
 
                 # Find and click project option
                 project_option = page.locator(f'option:has-text("{google_cloud_project}")')
-                if await project_option.is_visible():
+                try:
+                    await expect(project_option).to_be_visible(timeout=DIALOG_LOAD_TIMEOUT * 1000)
                     await project_option.click()
                     logger.info(f"Selected Google Cloud project: {google_cloud_project}")
+                except AssertionError:
+                    logger.warning(f"Google Cloud project not listed: {google_cloud_project}")
 
             # Click deploy/redeploy button
-            redeploy_btn = page.locator('button', has_text="Redeploy").first
-            if await redeploy_btn.is_visible():
+            redeployed = False
+            if redeploy_visible or await redeploy_btn.is_visible():
                 await redeploy_btn.click()
+                redeployed = True
                 logger.info("Clicked 'Redeploy' button - deployment started")
 
-            # Wait for deployment to complete
+            # Wait for deployment to complete (Cloud Run URL shows up on the page)
             # Typically takes 30 seconds to 2 minutes
             logger.info("Waiting for deployment to complete (this may take 1-2 minutes)...")
-            await asyncio.sleep(60)  # Wait at least 1 minute
-
-            # Try to extract deployed URL from page
             deployed_url = None
-            page_text = await page.text_content('body')
+            url_element = page.locator('a[href*=".run.app"]').or_(
+                page.get_by_text(_RUN_APP_URL_RE)
+            ).first
+            failure_text = page.get_by_text(_DEPLOY_FAILED_RE).first
+
+            if redeployed:
+                # The dialog already shows the previous deployment's URL, so the
+                # URL alone says nothing about this deploy. Track the Redeploy
+                # button instead: it stops being an enabled button while the
+                # deploy runs and comes back once it has finished.
+                redeploy_ready = page.get_by_role(
+                    "button", name=_REDEPLOY_RE, disabled=False
+                ).first
+                try:
+                    await expect(redeploy_ready).to_be_hidden(timeout=DIALOG_LOAD_TIMEOUT * 1000)
+                except AssertionError:
+                    logger.error("Redeploy button stayed enabled; deployment did not start")
+                    return {
+                        "status": "error",
+                        "project": google_cloud_project,
+                        "error": "Deployment did not start: Redeploy button stayed enabled after clicking it"
+                    }
+                try:
+                    await redeploy_ready.or_(failure_text).first.wait_for(
+                        state="visible", timeout=DEPLOYMENT_TIMEOUT * 1000
+                    )
+                except PlaywrightTimeoutError:
+                    logger.error(f"Redeploy still running after {DEPLOYMENT_TIMEOUT}s")
+                    return {
+                        "status": "timeout",
+                        "project": google_cloud_project,
+                        "error": f"Deployment did not finish within {DEPLOYMENT_TIMEOUT} seconds"
+                    }
 
-            # Look for deployed URL pattern (https://[name].run.app)
-            import re
-            url_pattern = r'https://[a-zA-Z0-9\-]+\.run\.app/?'
-            matches = re.findall(url_pattern, page_text or '')
-            if matches:
-                deployed_url = matches[0]
-                logger.info(f"Deployed URL: {deployed_url}")
+            try:
+                # Whichever shows up first: the Cloud Run URL or a failure banner
+                await url_element.or_(failure_text).first.wait_for(
+                    state="visible", timeout=DEPLOYMENT_TIMEOUT * 1000
+                )
+                if await failure_text.is_visible():
+                    failure = await failure_text.text_content()
+                    logger.error(f"Deployment failed: {failure}")
+                    return {
+                        "status": "error",
+                        "project": google_cloud_project,
+                        "error": failure
+                    }
+
+                # Read only the matching element, not the whole page body
+                url_text = await url_element.get_attribute("href") or await url_element.text_content()
+                match = _RUN_APP_URL_RE.search(url_text or '')
+                if match:
+                    deployed_url = match.group()
+                    logger.info(f"Deployed URL: {deployed_url}")
+            except PlaywrightTimeoutError:
+                logger.warning(f"No Cloud Run URL visible after {DEPLOYMENT_TIMEOUT}s")
 
             return {
                 "status": "success",
@@ -382,7 +800,8 @@ class AIStudioAutomation:
         Returns:
             Dict: Clone status and path
 
-        Uses: subprocess for git operations
+        Uses: asyncio subprocess for git operations, so the event loop keeps
+        serving other tool calls while the clone runs
         """
         logger.info(f"Cloning repository: {repo_url}")
 
@@ -390,20 +809,33 @@ class AIStudioAutomation:
             # Ensure local path exists
             local_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Clone repository
-            result = subprocess.run(
-                ["git", "clone", "--depth", "1", "--branch", branch, repo_url, str(local_path)],
-                capture_output=True,
-                text=True,
-                timeout=60
+            # Clone repository (shallow, single branch, blobs fetched lazily;
+            # protocol v2 only advertises the refs the clone asks for)
+            proc = await asyncio.create_subprocess_exec(
+                "git", "-c", "protocol.version=2", "clone",
+                "--depth", "1",
+                "--single-branch",
+                "--no-tags",
+                "--filter=blob:none",
+                "--branch", branch,
+                repo_url, str(local_path),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
             )
-
-            if result.returncode != 0:
-                logger.error(f"Git clone failed: {result.stderr}")
+            try:
+                _, stderr = await asyncio.wait_for(proc.communicate(), timeout=60)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                raise
+
+            if proc.returncode != 0:
+                error = stderr.decode(errors="replace")
+                logger.error(f"Git clone failed: {error}")
                 return {
                     "status": "error",
                     "repo_url": repo_url,
-                    "error": result.stderr
+                    "error": error
                 }
 
             logger.info(f"Repository cloned to: {local_path}")
@@ -424,7 +856,7 @@ class AIStudioAutomation:
                     "error": "Clone succeeded but .git directory not found"
                 }
 
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             logger.error("Git clone timed out")
             return {
                 "status": "error",
@@ -448,9 +880,12 @@ class AIStudioAutomation:
         Verify that Gemini implementation is complete.
 
         Critical timing pattern from llms-aistudio-04-browser-automation-reference.md:
-        - Minimum wait: 90 seconds
         - Typical: 2-5 minutes
-        - Check every 30 seconds until Stop button disappears
+        - First waits (up to GENERATION_START_TIMEOUT) for the Stop button to
+          appear, so a page that has not started generating is not mistaken
+          for a finished one; returns "not_started" if it never shows
+        - Then returns as soon as the Stop button disappears (no fixed minimum
+          wait) or AI Studio shows an internal error, whichever comes first
 
         Args:
             page: Playwright page with Gemini processing
@@ -459,40 +894,78 @@ class AIStudioAutomation:
         Returns:
             Dict: Completion status and duration
         """
-        logger.info(f"Waiting for Gemini implementation (min {GEMINI_IMPLEMENTATION_WAIT}s)...")
+        logger.info(f"Waiting for Gemini implementation (max {timeout_seconds}s)...")
 
-        # Initial wait (critical!)
-        await asyncio.sleep(GEMINI_IMPLEMENTATION_WAIT)
-        logger.info(f"Initial {GEMINI_IMPLEMENTATION_WAIT}s wait complete")
+        start_time = time.monotonic()
 
-        start_time = datetime.now()
-        elapsed = 0
+        stop_btn = page.locator('button[aria-label*="Stop"]').first
+        error_text = page.get_by_text(_INTERNAL_ERROR_RE).first
 
-        while elapsed < timeout_seconds:
-            try:
-                # Check for Stop button (indicates still processing)
-                stop_btn = page.locator('button[aria-label*="Stop"]').first
-                is_processing = await stop_btn.is_visible()
+        # A hidden Stop button also means "not started yet", so require it to
+        # show up before treating its disappearance as completion
+        start_timeout = min(GENERATION_START_TIMEOUT, timeout_seconds)
+        try:
+            await stop_btn.or_(error_text).first.wait_for(
+                state="visible", timeout=start_timeout * 1000
+            )
+        except PlaywrightTimeoutError:
+            duration = time.monotonic() - start_time
+            logger.error(f"Gemini generation did not start within {start_timeout}s")
+            return {
+                "status": "not_started",
+                "duration_seconds": duration,
+                "error": (
+                    f"Gemini's Stop button did not appear within {start_timeout} seconds; "
+                    "generation never started or had already finished before the wait began"
+                )
+            }
 
-                if not is_processing:
-                    duration = (datetime.now() - start_time).total_seconds()
-                    logger.info(f"Implementation complete! Total wait time: {duration:.1f}s")
+        # Stop button is visible while Gemini is still processing; race it
+        # against the error banner so failures return without waiting out
+        # the full timeout
+        # Floor at 1s: a Playwright timeout of 0 would mean "wait forever"
+        remaining_ms = max(timeout_seconds - (time.monotonic() - start_time), 1) * 1000
+        completed = asyncio.create_task(
+            stop_btn.wait_for(state="hidden", timeout=remaining_ms)
+        )
+        failed = asyncio.create_task(
+            error_text.wait_for(state="visible", timeout=remaining_ms)
+        )
+        heartbeat = asyncio.create_task(
+            _log_heartbeat("Still waiting for Gemini...", start_time)
+        )
+        try:
+            done, pending = await asyncio.wait(
+                {completed, failed}, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            heartbeat.cancel()
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
 
-                    return {
-                        "status": "complete",
-                        "duration_seconds": duration,
-                        "completed_at": datetime.now().isoformat()
-                    }
+        duration = time.monotonic() - start_time
 
-                # Still processing, wait and check again
-                logger.info(f"Still processing... ({elapsed:.0f}s elapsed)")
-                await asyncio.sleep(VERIFICATION_RETRY_WAIT)
-                elapsed = (datetime.now() - start_time).total_seconds()
+        if failed in done and failed.exception() is None:
+            logger.error(f"Gemini reported an internal error after {duration:.1f}s")
+            return {
+                "status": "error",
+                "duration_seconds": duration,
+                "error": "AI Studio reported an internal error during implementation"
+            }
 
-            except Exception as e:
-                logger.warning(f"Error checking completion status: {e}")
-                await asyncio.sleep(VERIFICATION_RETRY_WAIT)
-                elapsed = (datetime.now() - start_time).total_seconds()
+        if completed in done and completed.exception() is None:
+            logger.info(f"Implementation complete! Total wait time: {duration:.1f}s")
+            return {
+                "status": "complete",
+                "duration_seconds": duration,
+                "completed_at": datetime.now().isoformat()
+            }
+
+        for task in done:
+            exc = task.exception()
+            if exc is not None and not isinstance(exc, PlaywrightTimeoutError):
+                raise exc
 
         logger.error(f"Implementation wait timeout after {timeout_seconds}s")
         return {
@@ -503,12 +976,14 @@ class AIStudioAutomation:
 
     async def cleanup(self):
         """Close browser and clean up resources."""
-        if self.context:
-            await self.context.close()
-            logger.info("Closed browser context")
         if self.browser:
+            # Closing the browser closes its contexts too
             await self.browser.close()
             logger.info("Closed browser")
+        elif self.context:
+            await self.context.close()
+            logger.info("Closed browser context")
+        self.browser = self.context = self.page = None
 
 
 # Standalone functions for MCP tool wrapping
@@ -516,7 +991,8 @@ async def aistudio_create_github_repo(
     app_url: str,
     repo_name: str,
     description: str,
-    use_existing_auth: bool = True
+    use_existing_auth: bool = True,
+    session_id: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Standalone function: Create GitHub repository for AI Studio project.
@@ -528,6 +1004,7 @@ async def aistudio_create_github_repo(
         repo_name: Repository name
         description: Repository description
         use_existing_auth: Use saved authentication state
+        session_id: Keep the page open in this session for follow-up calls
 
     Returns:
         Dict: Repository creation status
@@ -536,16 +1013,9 @@ async def aistudio_create_github_repo(
 
     try:
         if use_existing_auth and STORAGE_STATE_PATH.exists():
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=False)
-                context = await browser.new_context(
-                    storage_state=str(STORAGE_STATE_PATH)
-                )
-                page = await automation.open_github_panel(context, app_url)
-                result = await automation.create_github_repo(page, repo_name, description)
-                await context.close()
-                await browser.close()
-                return result
+            async with app_page(app_url, session_id) as page:
+                await automation.open_github_panel(page.context, app_url, page=page)
+                return await automation.create_github_repo(page, repo_name, description)
         else:
             logger.error("No saved authentication state. Run login first.")
             return {"status": "error", "error": "Not authenticated"}
@@ -559,7 +1029,8 @@ async def aistudio_commit_and_deploy(
     app_url: str,
     commit_message: str,
     google_cloud_project: str,
-    issue_number: Optional[int] = None
+    issue_number: Optional[int] = None,
+    session_id: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Standalone function: Commit to GitHub and deploy to Cloud Run.
@@ -571,6 +1042,7 @@ async def aistudio_commit_and_deploy(
         commit_message: Commit message
         google_cloud_project: Google Cloud project ID
         issue_number: Optional GitHub issue number
+        session_id: Reuse (or start) the page cached under this session
 
     Returns:
         Dict: Combined commit and deployment status
@@ -578,15 +1050,7 @@ async def aistudio_commit_and_deploy(
     automation = AIStudioAutomation()
 
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=False)
-            context = await browser.new_context(
-                storage_state=str(STORAGE_STATE_PATH)
-            )
-            page = await context.new_page()
-            await page.goto(app_url)
-            await asyncio.sleep(NAVIGATION_WAIT)
-
+        async with app_page(app_url, session_id) as page:
             # Commit
             commit_result = await automation.commit_to_github(
                 page, commit_message, issue_number
@@ -597,9 +1061,6 @@ async def aistudio_commit_and_deploy(
                 page, google_cloud_project
             )
 
-            await context.close()
-            await browser.close()
-
             return {
                 "status": "success",
                 "commit": commit_result,
@@ -611,20 +1072,31 @@ async def aistudio_commit_and_deploy(
         return {"status": "error", "error": str(e)}
 
 
-if __name__ == "__main__":
-    # Example usage
+def main(argv: Optional[list] = None):
+    """Command-line entry point: `login` runs the interactive AI Studio login."""
     import sys
 
-    if len(sys.argv) > 1 and sys.argv[1] == "login":
+    argv = sys.argv[1:] if argv is None else argv
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    if argv and argv[0] == "login":
         # Run authentication
         async def run_login():
             automation = AIStudioAutomation()
-            context, page = await automation.login_aistudio()
-            await context.close()
-            await page.context.browser.close()
+            await automation.login_aistudio()
+            await automation.cleanup()
+            await shutdown_browser()
 
         asyncio.run(run_login())
     else:
         print("AI Studio Playwright Automation Helper")
         print("Usage: python aistudio-playwright-helper.py [login|...]")
         print("\nRun 'python aistudio-playwright-helper.py login' to authenticate")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,55 @@
 """
 Configuration constants for AI Studio MCP Server.
 """
+import os
 from pathlib import Path
 
 # Storage paths
 STORAGE_STATE_PATH = Path.home() / ".playwright" / "aistudio_auth_state.json"
-STORAGE_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+_storage_dir_ready = False
 
-# Critical timing patterns (from llms-aistudio-04-browser-automation-reference.md)
-GEMINI_IMPLEMENTATION_WAIT = 90  # Seconds - Gemini implementation minimum
-DIALOG_LOAD_WAIT = 8  # Seconds - GitHub/Deploy dialog rendering
-VERIFICATION_RETRY_WAIT = 3  # Seconds - Between verification checks
-NAVIGATION_WAIT = 3  # Seconds - Page navigation settle time
+
+def ensure_storage_dir():
+    """Create the storage state directory; call before writing STORAGE_STATE_PATH."""
+    global _storage_dir_ready
+    if not _storage_dir_ready:
+        STORAGE_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _storage_dir_ready = True
+
+
+# Saved logins younger than this are reused by aistudio_login without a browser
+AUTH_MAX_AGE = int(os.environ.get("AISTUDIO_AUTH_MAX_AGE", str(12 * 3600)))  # Seconds
+
+# Root log level applied by the server entry point (e.g. DEBUG, INFO, WARNING)
+LOG_LEVEL = os.environ.get("AISTUDIO_LOG_LEVEL", "INFO").upper()
+
+# Browser launch options for non-interactive tools (login is always headful)
+HEADLESS = os.environ.get("AISTUDIO_HEADLESS", "true").lower() not in ("0", "false", "no")
+BROWSER_ARGS = ["--disable-dev-shm-usage"]
+
+# Optional CDP endpoint of an already running Chromium (e.g. http://localhost:9222).
+# When set, tools attach to that browser instead of launching their own.
+CDP_ENDPOINT = os.environ.get("AISTUDIO_CDP_ENDPOINT")
+
+# Optional persistent Chromium profile for non-interactive tools. When set, tools
+# share one launch_persistent_context (warm HTTP cache, no per-call storage_state
+# rehydration); cookies from STORAGE_STATE_PATH are imported on launch and again
+# whenever the file changes.
+_user_data_dir = os.environ.get("AISTUDIO_USER_DATA_DIR")
+USER_DATA_DIR = Path(_user_data_dir).expanduser() if _user_data_dir else None
+
+# Maximum number of browser contexts open at once across concurrent tool calls
+MAX_CONCURRENCY = int(os.environ.get("AISTUDIO_MAX_CONCURRENCY", "4"))
+
+# Idle time after which a cached workflow session (context + page) is closed
+SESSION_IDLE_TTL = int(os.environ.get("AISTUDIO_SESSION_IDLE_TTL", "900"))  # Seconds
+
+# Upper bounds for event-driven waits (Playwright wait_for/expect timeouts)
+DIALOG_LOAD_TIMEOUT = 15  # Seconds - GitHub/Deploy dialog controls becoming visible
+GENERATION_START_TIMEOUT = 60  # Seconds - Gemini's Stop button appearing once generation starts
+REPO_CREATION_TIMEOUT = 10  # Seconds - Commit prompt appearing after repo creation
+COMMIT_TIMEOUT = 10  # Seconds - Stage-and-commit button clearing after commit
+DEPLOYMENT_TIMEOUT = 180  # Seconds - Cloud Run URL appearing after redeploy
 
 # Documentation base path
 DOCS_PATH = Path(__file__).parent.parent.parent / "docs"
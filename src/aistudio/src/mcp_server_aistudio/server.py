@@ -9,9 +9,11 @@ Provides tools, resources, and prompts for end-to-end development workflows.
 """
 
 import asyncio
+import functools
 import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Optional, Any
+from typing import AsyncIterator
 
 try:
     from mcp.server.fastmcp import FastMCP
@@ -20,17 +22,30 @@ except ImportError:
 
 from .automation import (
     AIStudioAutomation,
-    aistudio_create_github_repo,
-    aistudio_commit_and_deploy,
+    saved_auth_is_fresh,
+    aistudio_create_github_repo as do_aistudio_create_github_repo,
+    aistudio_commit_and_deploy as do_aistudio_commit_and_deploy,
+    app_page,
+    close_session,
+    shutdown_browser,
 )
-from .config import STORAGE_STATE_PATH, DOCS_PATH
+from .config import STORAGE_STATE_PATH, DOCS_PATH, LOG_LEVEL
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close the shared Playwright browser when the server shuts down."""
+    try:
+        yield
+    finally:
+        await shutdown_browser()
+
+
 # Create FastMCP server
-mcp = FastMCP(name="aistudio")
+mcp = FastMCP(name="aistudio", lifespan=lifespan)
 
 
 # ============================================================================
@@ -38,16 +53,24 @@ mcp = FastMCP(name="aistudio")
 # ============================================================================
 
 @mcp.tool()
-async def aistudio_login() -> dict:
-    """Authenticate to Google AI Studio and save session state."""
+async def aistudio_login(force: bool = False) -> dict:
+    """Authenticate to Google AI Studio and save session state.
+
+    A recent saved session is reused without opening a browser unless force is set.
+    """
+    if not force and saved_auth_is_fresh():
+        logger.info("Saved AI Studio session is recent, skipping browser login")
+        return {
+            "status": "success",
+            "message": f"Reusing recent session saved at {STORAGE_STATE_PATH} (pass force=true to log in again)",
+            "storage_state_path": str(STORAGE_STATE_PATH)
+        }
+
     logger.info("Starting AI Studio authentication...")
+    automation = AIStudioAutomation()
     try:
-        automation = AIStudioAutomation()
-        context, page = await automation.login_aistudio()
-
-        await context.storage_state(path=str(STORAGE_STATE_PATH))
-        await context.close()
-        await page.context.browser.close()
+        # login_aistudio saves the storage state itself
+        await automation.login_aistudio()
 
         return {
             "status": "success",
@@ -60,6 +83,12 @@ async def aistudio_login() -> dict:
             "status": "error",
             "error": str(e)
         }
+    finally:
+        # Close the login browser on failure too, exactly once
+        try:
+            await automation.cleanup()
+        except Exception as e:
+            logger.warning(f"Closing login browser failed: {e}")
 
 
 @mcp.tool()
@@ -67,16 +96,21 @@ async def aistudio_create_repo(
     app_url: str,
     repo_name: str,
     description: str,
-    visibility: str = "private"
+    visibility: str = "private",
+    session_id: str | None = None
 ) -> dict:
-    """Create GitHub repository for AI Studio project."""
+    """Create GitHub repository for AI Studio project.
+
+    Pass a session_id to keep the page open for follow-up tools.
+    """
     logger.info(f"Creating repository: {repo_name}")
     try:
-        result = await aistudio_create_github_repo(
+        result = await do_aistudio_create_github_repo(
             app_url=app_url,
             repo_name=repo_name,
             description=description,
-            use_existing_auth=True
+            use_existing_auth=True,
+            session_id=session_id
         )
         logger.info(f"Repository creation result: {result}")
         return result
@@ -94,16 +128,21 @@ async def aistudio_commit_and_deploy(
     app_url: str,
     commit_message: str,
     google_cloud_project: str,
-    issue_number: Optional[int] = None
+    issue_number: int | None = None,
+    session_id: str | None = None
 ) -> dict:
-    """Commit to GitHub and deploy to Cloud Run."""
+    """Commit to GitHub and deploy to Cloud Run.
+
+    Pass the session_id used for aistudio_create_repo to reuse its page.
+    """
     logger.info(f"Committing and deploying to {google_cloud_project}")
     try:
-        result = await aistudio_commit_and_deploy(
+        result = await do_aistudio_commit_and_deploy(
             app_url=app_url,
             commit_message=commit_message,
             google_cloud_project=google_cloud_project,
-            issue_number=issue_number
+            issue_number=issue_number,
+            session_id=session_id
         )
         logger.info(f"Commit and deploy result: {result}")
         return result
@@ -144,32 +183,24 @@ async def aistudio_clone_repository(
 @mcp.tool()
 async def aistudio_wait_for_implementation(
     app_url: str,
-    timeout_seconds: int = 300
+    timeout_seconds: int = 300,
+    session_id: str | None = None
 ) -> dict:
-    """Wait for Gemini implementation to complete."""
+    """Wait for Gemini implementation to complete.
+
+    Pass a session_id to reuse a page opened by an earlier tool call.
+    """
     logger.info(f"Waiting for implementation (max {timeout_seconds}s)")
     try:
-        from playwright.async_api import async_playwright
-
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=False)
-            context = await browser.new_context(
-                storage_state=str(STORAGE_STATE_PATH)
-            )
-            page = await context.new_page()
-            await page.goto(app_url)
-
+        async with app_page(app_url, session_id) as page:
             automation = AIStudioAutomation()
             result = await automation.wait_for_gemini_implementation(
                 page=page,
                 timeout_seconds=timeout_seconds
             )
 
-            await context.close()
-            await browser.close()
-
-            logger.info(f"Implementation wait result: {result}")
-            return result
+        logger.info(f"Implementation wait result: {result}")
+        return result
     except Exception as e:
         logger.error(f"Wait for implementation failed: {e}")
         return {
@@ -178,51 +209,112 @@ async def aistudio_wait_for_implementation(
         }
 
 
+@mcp.tool()
+async def aistudio_close_session(session_id: str) -> dict:
+    """Close a browser session opened by passing session_id to another tool."""
+    logger.info(f"Closing session: {session_id}")
+    try:
+        closed = await close_session(session_id)
+        return {
+            "status": "success" if closed else "not_found",
+            "session_id": session_id
+        }
+    except Exception as e:
+        logger.error(f"Closing session failed: {e}")
+        return {
+            "status": "error",
+            "session_id": session_id,
+            "error": str(e)
+        }
+
+
+@mcp.tool()
+async def aistudio_get_docs(doc_keys: list[str]) -> dict:
+    """Get several AI Studio documentation files in one call."""
+    logger.info(f"Reading documentation: {', '.join(doc_keys)}")
+    unknown = [key for key in doc_keys if key not in DOC_FILES]
+    if unknown:
+        return {
+            "status": "error",
+            "error": f"Unknown documents: {', '.join(unknown)}",
+            "available": list(DOC_FILES)
+        }
+    try:
+        # Read files concurrently off the event loop (cold cache hits disk)
+        contents = await asyncio.gather(
+            *(asyncio.to_thread(_read_doc, DOC_FILES[key]) for key in doc_keys)
+        )
+        return {
+            "status": "success",
+            "docs": dict(zip(doc_keys, contents))
+        }
+    except Exception as e:
+        logger.error(f"Reading documentation failed: {e}")
+        return {
+            "status": "error",
+            "error": str(e)
+        }
+
+
 # ============================================================================
 # RESOURCES - Documentation accessible via MCP
 # ============================================================================
 
+# Documentation key -> filename under DOCS_PATH
+DOC_FILES = {
+    "start-here": "00-start-here.md",
+    "workflow-new-project": "01-workflow-new-project.md",
+    "workflow-existing-project": "02-workflow-existing-project.md",
+    "ai-features-catalog": "03-ai-features-catalog.md",
+    "browser-automation-reference": "04-browser-automation-reference.md",
+    "llm-decision-guide": "05-llm-decision-guide.md",
+    "best-practices-antipatterns": "06-best-practices-antipatterns.md",
+    "mcp-server-setup": "07-mcp-server-setup.md",
+    "mcp-quick-reference": "08-mcp-quick-reference.md",
+    "legacy-workflow-new-project": "legacy-workflow-new-project.md",
+    "legacy-workflow": "legacy-workflow.md",
+    "legacy-ai-features-exploration": "legacy-ai-features-exploration.md",
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _read_doc_version(filename: str, mtime_ns: int) -> str:
+    """Read one version of a documentation file; mtime_ns keys the cache."""
+    return (DOCS_PATH / filename).read_text(encoding="utf-8")
+
+
+def _read_doc(filename: str) -> str:
+    """Read a documentation file, re-reading it only after it changes on disk."""
+    file_path = DOCS_PATH / filename
+    try:
+        mtime_ns = file_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Documentation file not found: {filename}") from None
+    return _read_doc_version(filename, mtime_ns)
+
+
 @mcp.resource("aistudio://docs/{doc_key}")
 async def get_documentation(doc_key: str) -> str:
     """Get AI Studio documentation by key."""
-    doc_files = {
-        "start-here": "00-start-here.md",
-        "workflow-new-project": "01-workflow-new-project.md",
-        "workflow-existing-project": "02-workflow-existing-project.md",
-        "ai-features-catalog": "03-ai-features-catalog.md",
-        "browser-automation-reference": "04-browser-automation-reference.md",
-        "llm-decision-guide": "05-llm-decision-guide.md",
-        "best-practices-antipatterns": "06-best-practices-antipatterns.md",
-        "mcp-server-setup": "07-mcp-server-setup.md",
-        "mcp-quick-reference": "08-mcp-quick-reference.md",
-        "legacy-workflow-new-project": "legacy-workflow-new-project.md",
-        "legacy-workflow": "legacy-workflow.md",
-        "legacy-ai-features-exploration": "legacy-ai-features-exploration.md",
-    }
-
-    filename = doc_files.get(doc_key)
+    filename = DOC_FILES.get(doc_key)
     if not filename:
         raise ValueError(f"Unknown document: {doc_key}")
 
-    file_path = DOCS_PATH / filename
-    if not file_path.exists():
-        raise FileNotFoundError(f"Documentation file not found: {filename}")
-
-    return file_path.read_text(encoding="utf-8")
+    # Stat/read off the event loop; cache hits return almost immediately
+    return await asyncio.to_thread(_read_doc, filename)
 
 
 # ============================================================================
 # PROMPTS - Pre-configured workflows
 # ============================================================================
 
-@mcp.prompt()
-async def create_new_project(
-    project_name: str,
-    project_description: str,
-    google_cloud_project: str
-) -> str:
-    """Complete workflow for creating a brand new AI Studio project from scratch."""
-    return f"""# Create New AI Studio Project: {project_name}
+def _with_reference_docs(body: str, doc_key: str) -> str:
+    """Append the shared reference-documentation footer to a prompt template."""
+    return f"{body}\n## Reference Documentation\n- Read aistudio://docs/{doc_key} for detailed guidance\n"
+
+
+# Prompt bodies are built once at import and filled per call
+_CREATE_NEW_PROJECT_PROMPT = _with_reference_docs("""# Create New AI Studio Project: {project_name}
 
 ## Project Overview
 **Name**: {project_name}
@@ -239,7 +331,7 @@ async def create_new_project(
 1. Navigate to AI Studio and create new project
 2. Draft implementation prompt using RISE framework
 3. Send prompt to Gemini for implementation
-4. Use `aistudio_wait_for_implementation` tool (minimum 90 seconds)
+4. Use `aistudio_wait_for_implementation` tool right after sending the prompt (returns when Gemini finishes, typically 2-5 minutes)
 
 ### Phase 3: Repository Setup
 1. Edit project name with UUID prefix for traceability
@@ -250,20 +342,9 @@ async def create_new_project(
 
 ### Phase 5: Local Setup
 1. Use `aistudio_clone_repository` tool
+""", "workflow-new-project")
 
-## Reference Documentation
-- Read aistudio://docs/workflow-new-project for detailed guidance
-"""
-
-
-@mcp.prompt()
-async def enhance_existing_project(
-    app_url: str,
-    enhancement_description: str,
-    google_cloud_project: str
-) -> str:
-    """Workflow for enhancing an existing AI Studio project."""
-    return f"""# Enhance Existing AI Studio Project
+_ENHANCE_EXISTING_PROJECT_PROMPT = _with_reference_docs("""# Enhance Existing AI Studio Project
 
 ## Enhancement Details
 **Project URL**: {app_url}
@@ -275,15 +356,47 @@ async def enhance_existing_project(
 2. Use `aistudio_wait_for_implementation` tool
 3. Use `aistudio_commit_and_deploy` tool
 4. Verify deployed application
-"""
+""", "workflow-existing-project")
+
+
+@mcp.prompt()
+def create_new_project(
+    project_name: str,
+    project_description: str,
+    google_cloud_project: str
+) -> str:
+    """Complete workflow for creating a brand new AI Studio project from scratch."""
+    return _CREATE_NEW_PROJECT_PROMPT.format(
+        project_name=project_name,
+        project_description=project_description,
+        google_cloud_project=google_cloud_project
+    )
+
+
+@mcp.prompt()
+def enhance_existing_project(
+    app_url: str,
+    enhancement_description: str,
+    google_cloud_project: str
+) -> str:
+    """Workflow for enhancing an existing AI Studio project."""
+    return _ENHANCE_EXISTING_PROJECT_PROMPT.format(
+        app_url=app_url,
+        enhancement_description=enhancement_description,
+        google_cloud_project=google_cloud_project
+    )
 
 
 def main():
     """Main entry point for the server - this is a regular function, not async."""
-    logger.info("AI Studio MCP Server starting...")
-    logger.info("Available tools: aistudio_login, aistudio_create_repo, aistudio_commit_and_deploy, aistudio_clone_repository, aistudio_wait_for_implementation")
-    logger.info("Available resources: Documentation via aistudio://docs/*")
-    logger.info("Available prompts: create-new-project, enhance-existing-project")
+    logging.basicConfig(level=LOG_LEVEL)
+    # One record for the whole banner
+    logger.info(
+        "AI Studio MCP Server starting...\n"
+        "Available tools: aistudio_login, aistudio_create_repo, aistudio_commit_and_deploy, aistudio_clone_repository, aistudio_wait_for_implementation, aistudio_close_session, aistudio_get_docs\n"
+        "Available resources: Documentation via aistudio://docs/*\n"
+        "Available prompts: create-new-project, enhance-existing-project"
+    )
     mcp.run()
 
 
@@ -0,0 +1,224 @@
+import asyncio
+import json
+import os
+import time
+
+import pytest
+
+from mcp_server_aistudio import automation
+
+
+@pytest.fixture
+def storage_state_path(tmp_path, monkeypatch):
+    path = tmp_path / "aistudio_auth_state.json"
+    monkeypatch.setattr(automation, "STORAGE_STATE_PATH", path)
+    monkeypatch.setattr(automation, "_storage_state_cache", None)
+    return path
+
+
+class FakeContext:
+    def __init__(self, page):
+        self.page = page
+
+    async def close(self):
+        self.page.closed = True
+
+
+class FakePage:
+    """Just enough of a Playwright Page for _SessionCache."""
+
+    def __init__(self):
+        self.url = "about:blank"
+        self.closed = False
+        self.context = FakeContext(self)
+
+    def is_closed(self):
+        return self.closed
+
+    async def goto(self, url):
+        self.url = url
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def sessions(monkeypatch):
+    """A fresh _SessionCache over fake pages, and the list of pages it opened."""
+    opened = []
+
+    async def open_page():
+        page = FakePage()
+        opened.append(page)
+        return page
+
+    monkeypatch.setattr(automation, "USER_DATA_DIR", None)
+    monkeypatch.setattr(automation, "_open_page", open_page)
+    monkeypatch.setattr(automation, "_context_slots", asyncio.Semaphore(2))
+    return automation._SessionCache(), opened
+
+
+def write_state(path, cookies):
+    path.write_text(json.dumps({"cookies": cookies, "origins": []}), encoding="utf-8")
+
+
+def test_saved_auth_is_fresh_recent_login(storage_state_path):
+    write_state(storage_state_path, [
+        {"name": "SID", "value": "a", "expires": time.time() + 3600},
+        {"name": "__Secure-1PSID", "value": "b", "expires": -1},
+    ])
+
+    assert automation.saved_auth_is_fresh(max_age=60)
+
+
+def test_saved_auth_is_fresh_ignores_expired_tracking_cookies(storage_state_path):
+    write_state(storage_state_path, [
+        {"name": "SID", "value": "a", "expires": time.time() + 3600},
+        {"name": "NID", "value": "b", "expires": time.time() - 60},
+    ])
+
+    assert automation.saved_auth_is_fresh(max_age=60)
+
+
+def test_saved_auth_is_fresh_expired_auth_cookie(storage_state_path):
+    write_state(storage_state_path, [
+        {"name": "__Secure-3PSID", "value": "a", "expires": time.time() - 60},
+    ])
+
+    assert not automation.saved_auth_is_fresh(max_age=60)
+
+
+def test_saved_auth_is_fresh_stale_file(storage_state_path):
+    write_state(storage_state_path, [{"name": "SID", "value": "a", "expires": -1}])
+    old = time.time() - 120
+    os.utime(storage_state_path, (old, old))
+
+    assert not automation.saved_auth_is_fresh(max_age=60)
+
+
+def test_saved_auth_is_fresh_missing_file(storage_state_path):
+    assert not automation.saved_auth_is_fresh(max_age=60)
+
+
+@pytest.mark.parametrize("content", [
+    "",
+    "{not json",
+    "[]",
+    '{"origins": []}',
+    '{"cookies": []}',
+    '{"cookies": "SID"}',
+])
+def test_saved_auth_is_fresh_malformed_file(storage_state_path, content):
+    storage_state_path.write_text(content, encoding="utf-8")
+
+    assert not automation.saved_auth_is_fresh(max_age=60)
+
+
+def test_save_storage_state_writes_new_state(storage_state_path):
+    state = {"cookies": [{"name": "SID", "value": "a"}], "origins": []}
+
+    assert automation._save_storage_state(storage_state_path, state)
+    assert json.loads(storage_state_path.read_text(encoding="utf-8")) == state
+    assert not storage_state_path.with_suffix(".json.tmp").exists()
+
+
+def test_save_storage_state_replaces_changed_state(storage_state_path):
+    write_state(storage_state_path, [{"name": "SID", "value": "old"}])
+    state = {"cookies": [{"name": "SID", "value": "new"}], "origins": []}
+
+    assert automation._save_storage_state(storage_state_path, state)
+    assert json.loads(storage_state_path.read_text(encoding="utf-8")) == state
+
+
+def test_save_storage_state_touches_unchanged_state(storage_state_path):
+    write_state(storage_state_path, [{"name": "SID", "value": "a"}])
+    content = storage_state_path.read_text(encoding="utf-8")
+    old = time.time() - 3600
+    os.utime(storage_state_path, (old, old))
+
+    assert not automation._save_storage_state(storage_state_path, json.loads(content))
+    assert storage_state_path.read_text(encoding="utf-8") == content
+    assert storage_state_path.stat().st_mtime > old + 1800
+
+
+def test_load_storage_state_rereads_only_after_mtime_changes(storage_state_path):
+    write_state(storage_state_path, [{"name": "SID", "value": "a"}])
+    mtime_ns = storage_state_path.stat().st_mtime_ns
+    first = automation._load_storage_state()
+
+    write_state(storage_state_path, [{"name": "SID", "value": "b"}])
+    os.utime(storage_state_path, ns=(mtime_ns, mtime_ns))
+    assert automation._load_storage_state() is first
+
+    os.utime(storage_state_path, ns=(mtime_ns + 1_000_000, mtime_ns + 1_000_000))
+    assert automation._load_storage_state()["cookies"][0]["value"] == "b"
+
+
+def test_session_cache_reuses_page_and_navigates(sessions):
+    session_cache, opened = sessions
+
+    async def run():
+        async with session_cache.use("s1", "https://example.com/a") as page:
+            assert page.url == "https://example.com/a"
+        async with session_cache.use("s1", "https://example.com/b") as again:
+            assert again is page
+            assert again.url == "https://example.com/b"
+
+    asyncio.run(run())
+    assert len(opened) == 1
+
+
+def test_session_cache_holds_a_slot_until_closed(sessions):
+    session_cache, opened = sessions
+
+    async def run():
+        async with session_cache.use("s1", "https://example.com"):
+            pass
+        async with session_cache.use("s2", "https://example.com"):
+            pass
+        assert automation._context_slots.locked()
+
+        assert await session_cache.close("s1")
+        assert not automation._context_slots.locked()
+        assert not await session_cache.close("s1")
+
+        await session_cache.close_all()
+        assert automation._context_slots._value == 2
+
+    asyncio.run(run())
+    assert all(page.closed for page in opened)
+
+
+def test_session_cache_evicts_idle_sessions(sessions, monkeypatch):
+    session_cache, opened = sessions
+    monkeypatch.setattr(automation, "SESSION_IDLE_TTL", 60)
+
+    async def run():
+        async with session_cache.use("idle", "https://example.com"):
+            pass
+        session_cache._sessions["idle"].last_used -= 61
+
+        async with session_cache.use("active", "https://example.com"):
+            pass
+
+        assert list(session_cache._sessions) == ["active"]
+        assert automation._context_slots._value == 1
+
+    asyncio.run(run())
+    assert opened[0].closed
+    assert not opened[1].closed
+
+
+def test_session_cache_keeps_sessions_in_use(sessions, monkeypatch):
+    session_cache, opened = sessions
+    monkeypatch.setattr(automation, "SESSION_IDLE_TTL", 60)
+
+    async def run():
+        async with session_cache.use("busy", "https://example.com"):
+            session_cache._sessions["busy"].last_used -= 61
+            async with session_cache.use("other", "https://example.com"):
+                pass
+            assert "busy" in session_cache._sessions
+
+    asyncio.run(run())
+    assert not opened[0].closed
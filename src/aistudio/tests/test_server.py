@@ -0,0 +1,75 @@
+import asyncio
+import os
+
+import pytest
+
+from mcp_server_aistudio import server
+
+
+@pytest.fixture
+def docs_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(server, "DOCS_PATH", tmp_path)
+    server._read_doc_version.cache_clear()
+    yield tmp_path
+    server._read_doc_version.cache_clear()
+
+
+def test_read_doc_caches_until_file_changes(docs_path):
+    doc = docs_path / "guide.md"
+    doc.write_text("v1", encoding="utf-8")
+    mtime_ns = doc.stat().st_mtime_ns
+
+    assert server._read_doc("guide.md") == "v1"
+
+    doc.write_text("v2", encoding="utf-8")
+    os.utime(doc, ns=(mtime_ns, mtime_ns))
+    assert server._read_doc("guide.md") == "v1"
+
+    os.utime(doc, ns=(mtime_ns + 1_000_000, mtime_ns + 1_000_000))
+    assert server._read_doc("guide.md") == "v2"
+
+
+def test_read_doc_missing_file(docs_path):
+    with pytest.raises(FileNotFoundError, match="missing.md"):
+        server._read_doc("missing.md")
+
+
+def test_get_documentation_unknown_key():
+    with pytest.raises(ValueError, match="Unknown document"):
+        asyncio.run(server.get_documentation("no-such-doc"))
+
+
+def test_doc_files_exist():
+    for filename in server.DOC_FILES.values():
+        assert (server.DOCS_PATH / filename).is_file(), filename
+
+
+def test_with_reference_docs_appends_footer():
+    prompt = server._with_reference_docs("# Title\n", "start-here")
+
+    assert prompt.startswith("# Title\n")
+    assert prompt.endswith(
+        "## Reference Documentation\n- Read aistudio://docs/start-here for detailed guidance\n"
+    )
+
+
+def test_create_new_project_prompt():
+    prompt = server.create_new_project("demo", "A demo app", "my-gcp-project")
+
+    assert prompt.startswith("# Create New AI Studio Project: demo\n")
+    assert "**Description**: A demo app" in prompt
+    assert "Google Cloud Run (my-gcp-project)" in prompt
+    assert "aistudio://docs/workflow-new-project" in prompt
+    assert "{" not in prompt
+
+
+def test_enhance_existing_project_prompt():
+    prompt = server.enhance_existing_project(
+        "https://aistudio.google.com/apps/123", "Add dark mode", "my-gcp-project"
+    )
+
+    assert "**Project URL**: https://aistudio.google.com/apps/123" in prompt
+    assert "**Enhancement**: Add dark mode" in prompt
+    assert "**Deployment Target**: my-gcp-project" in prompt
+    assert "aistudio://docs/workflow-existing-project" in prompt
+    assert "{" not in prompt
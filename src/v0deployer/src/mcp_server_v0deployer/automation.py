@@ -11,35 +11,186 @@ import asyncio
 import json
 import logging
 import os
+import tempfile
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import AsyncIterator, Dict, Any, Optional, Tuple
 
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page, TimeoutError
+from playwright.async_api import async_playwright, expect, Browser, BrowserContext, Page, Playwright, Route, TimeoutError
 
 from .config import (
     STORAGE_STATE_PATH,
     CONFIG_PATH,
-    DROPDOWN_WAIT,
+    DROPDOWN_TIMEOUT,
     SYNC_WAIT,
     PUBLISH_WAIT,
     VIEW_APP_WAIT,
+    HEADLESS,
+    BROWSER_ARGS,
+    USER_DATA_DIR,
+    SCREENSHOT_DIR,
+    SCREENSHOT_KEEP,
 )
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 
+_config_cache: Optional[Tuple[int, dict]] = None
+
+
 def load_config() -> dict:
-    """Loads the configuration from the JSON file in the CWD."""
-    if not CONFIG_PATH.exists():
-        raise FileNotFoundError(f"Configuration file not found: {CONFIG_PATH}")
+    """Loads the configuration from the JSON file in the CWD, re-parsing only when it changes."""
+    global _config_cache
+    try:
+        mtime_ns = CONFIG_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {CONFIG_PATH}") from None
+
+    if _config_cache is None or _config_cache[0] != mtime_ns:
+        _config_cache = (mtime_ns, json.loads(CONFIG_PATH.read_bytes()))
+    return _config_cache[1]
+
+
+# Resource types the pull/publish clicks never need. Stylesheets stay: the
+# visibility checks on v0's buttons depend on them.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+
+async def _abort_heavy_resources(route: Route):
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
 
-    with open(CONFIG_PATH, 'r') as f:
-        return json.load(f)
+
+async def _block_heavy_resources(page: Page):
+    """Skip downloading images, media and fonts on a page used only for clicks."""
+    await page.route("**/*", _abort_heavy_resources)
+
+
+async def _save_error_screenshot(page: Page, prefix: str) -> str:
+    """Screenshot page into SCREENSHOT_DIR, pruning all but the newest SCREENSHOT_KEEP files."""
+    SCREENSHOT_DIR.mkdir(parents=True, exist_ok=True)
+    # Unique file per failure so concurrent calls don't overwrite each other
+    fd, path = tempfile.mkstemp(prefix=prefix, suffix=".png", dir=SCREENSHOT_DIR)
+    os.close(fd)
+    await page.screenshot(path=path)
+
+    try:
+        screenshots = sorted(SCREENSHOT_DIR.glob("*.png"), key=lambda p: p.stat().st_mtime, reverse=True)
+        for old in screenshots[SCREENSHOT_KEEP:]:
+            old.unlink(missing_ok=True)
+    except OSError as e:
+        # A concurrent prune removed a file mid-scan; the next failure retries
+        logger.debug(f"Skipped screenshot pruning: {e}")
+    return path
+
+
+class _BrowserPool:
+    """
+    Process-wide Playwright driver and Chromium browser shared by all tool calls.
+
+    Launching Chromium costs far more than the clicks each tool performs, so
+    the pool launches it once on first use and keeps it alive. Each call still
+    gets its own BrowserContext built from the saved auth state, unless
+    USER_DATA_DIR is set, in which case all calls share one persistent profile.
+    """
+
+    def __init__(self):
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._persistent: Optional[BrowserContext] = None
+        # mtime of the storage state last imported into _persistent
+        self._cookies_mtime_ns: Optional[int] = None
+        self._lock = asyncio.Lock()
+
+    async def _ensure_playwright(self) -> Playwright:
+        # Caller must hold self._lock
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        return self._playwright
+
+    async def get_browser(self) -> Browser:
+        """Return the shared browser, launching it on first use."""
+        async with self._lock:
+            if self._browser is None or not self._browser.is_connected():
+                playwright = await self._ensure_playwright()
+                self._browser = await playwright.chromium.launch(headless=HEADLESS, args=BROWSER_ARGS)
+                logger.info(f"Launched shared Chromium browser (headless={HEADLESS})")
+            return self._browser
+
+    async def get_persistent_context(self) -> BrowserContext:
+        """
+        Return the shared USER_DATA_DIR context, launching it on first use.
+
+        Cookies from STORAGE_STATE_PATH are imported on launch and again
+        whenever the file changes, so a later v0_login takes effect without
+        restarting the server.
+        """
+        async with self._lock:
+            if self._persistent is None:
+                playwright = await self._ensure_playwright()
+                context = await playwright.chromium.launch_persistent_context(
+                    str(USER_DATA_DIR), headless=HEADLESS, args=BROWSER_ARGS
+                )
+                context.on("close", lambda _: setattr(self, "_persistent", None))
+                self._persistent = context
+                self._cookies_mtime_ns = None
+                logger.info(f"Launched persistent browser profile: {USER_DATA_DIR}")
+            mtime_ns = STORAGE_STATE_PATH.stat().st_mtime_ns
+            if mtime_ns != self._cookies_mtime_ns:
+                await self._persistent.add_cookies(_load_storage_state().get("cookies", []))
+                self._cookies_mtime_ns = mtime_ns
+                logger.info(f"Imported cookies from {STORAGE_STATE_PATH}")
+            return self._persistent
+
+    async def close(self):
+        """Close the shared browser and stop the Playwright driver."""
+        async with self._lock:
+            if self._persistent is not None:
+                await self._persistent.close()
+                self._persistent = None
+            if self._browser is not None:
+                await self._browser.close()
+                self._browser = None
+                logger.info("Closed shared browser")
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+
+_pool = _BrowserPool()
+
+
+@asynccontextmanager
+async def browser_context(**kwargs: Any) -> AsyncIterator[BrowserContext]:
+    """Open a BrowserContext on the shared browser and close it on exit."""
+    browser = await _pool.get_browser()
+    context = await browser.new_context(**kwargs)
+    try:
+        yield context
+    finally:
+        await context.close()
+
+
+@asynccontextmanager
+async def tool_context() -> AsyncIterator[BrowserContext]:
+    """
+    Authenticated context for one tool call.
+
+    The shared USER_DATA_DIR profile when configured (left open for the next
+    call), otherwise a fresh context from the saved auth state.
+    """
+    if USER_DATA_DIR:
+        yield await _pool.get_persistent_context()
+    else:
+        async with browser_context(storage_state=_load_storage_state()) as context:
+            yield context
+
+
+async def shutdown_browser():
+    """Release the shared browser and driver; call once on server shutdown."""
+    await _pool.close()
 
 
 class V0Automation:
@@ -116,30 +267,42 @@ class V0Automation:
                 "error": str(e)
             }
 
-    async def git_pull_changes(self, context: BrowserContext, v0_chat_url: str) -> Dict[str, Any]:
+    async def git_pull_changes(
+        self,
+        context: BrowserContext,
+        v0_chat_url: str,
+        page: Optional[Page] = None
+    ) -> Dict[str, Any]:
         """
         Automate the git pull process using an authenticated context.
 
         Args:
             context: Authenticated Playwright context
             v0_chat_url: URL to the v0.dev chat/project page
+            page: Page already showing v0_chat_url; a new page is opened
+                  (and closed afterwards) if omitted
 
         Returns:
             Dict: Status of git pull operation
         """
-        page = await context.new_page()
+        owns_page = page is None
+        if owns_page:
+            page = await context.new_page()
         try:
-            logger.info(f"Navigating to {v0_chat_url} for git pull...")
-            await page.goto(v0_chat_url)
-            await page.get_by_role("button", name="Synced to main").wait_for(state="visible", timeout=60000)
+            if owns_page:
+                await _block_heavy_resources(page)
+                logger.info(f"Navigating to {v0_chat_url} for git pull...")
+                await page.goto(v0_chat_url)
+            synced_btn = page.get_by_role("button", name="Synced to main")
+            await synced_btn.wait_for(state="visible", timeout=60000)
 
             logger.info("Clicking 'Synced to main' button...")
-            await page.get_by_role("button", name="Synced to main").click()
+            await synced_btn.click()
 
             logger.info("Clicking 'Pull Changes' button...")
             await page.get_by_role("button", name="Pull Changes").click()
 
-            await page.get_by_text("Syncing Changes").wait_for(state="hidden", timeout=SYNC_WAIT * 1000)
+            await expect(page.get_by_text("Syncing Changes")).to_be_hidden(timeout=SYNC_WAIT * 1000)
             logger.info("Git pull changes completed successfully.")
 
             return {
@@ -154,9 +317,15 @@ class V0Automation:
                 "error": str(e)
             }
         finally:
-            await page.close()
-
-    async def publish_changes(self, context: BrowserContext, v0_chat_url: str) -> Dict[str, Any]:
+            if owns_page:
+                await page.close()
+
+    async def publish_changes(
+        self,
+        context: BrowserContext,
+        v0_chat_url: str,
+        page: Optional[Page] = None
+    ) -> Dict[str, Any]:
         """
         Automate the publish process using an authenticated context.
 
@@ -165,29 +334,45 @@ class V0Automation:
         Args:
             context: Authenticated Playwright context
             v0_chat_url: URL to the v0.dev chat/project page
+            page: Page already showing v0_chat_url; a new page is opened
+                  (and closed afterwards) if omitted
 
         Returns:
             Dict: Status of publish operation
         """
-        page = await context.new_page()
+        owns_page = page is None
+        if owns_page:
+            page = await context.new_page()
         try:
-            logger.info(f"Navigating to {v0_chat_url} for publishing...")
-            await page.goto(v0_chat_url)
-            await page.get_by_role("button", name="Publish").wait_for(state="visible", timeout=60000)
+            if owns_page:
+                await _block_heavy_resources(page)
+                logger.info(f"Navigating to {v0_chat_url} for publishing...")
+                await page.goto(v0_chat_url)
+            publish_btn = page.get_by_role("button", name="Publish")
+            await publish_btn.wait_for(state="visible", timeout=60000)
 
             logger.info("Clicking 'Publish' dropdown button...")
-            await page.get_by_role("button", name="Publish").click()
-            await page.wait_for_timeout(DROPDOWN_WAIT * 1000)
+            await publish_btn.click()
 
             publish_changes_option = page.get_by_text("Publish Changes")
             update_option = page.get_by_role("button", name="Update")
 
+            # Continue as soon as either dropdown entry renders; on timeout the
+            # checks below fall through to the error snapshot
+            try:
+                await publish_changes_option.or_(update_option).first.wait_for(
+                    state="visible", timeout=DROPDOWN_TIMEOUT * 1000
+                )
+            except TimeoutError:
+                logger.warning(f"Publish dropdown did not show an action within {DROPDOWN_TIMEOUT}s")
+
             if await publish_changes_option.is_visible():
                 logger.info("'Publish Changes' option is visible. Clicking it...")
                 await publish_changes_option.click()
-                await page.get_by_text("Publishing...").wait_for(state="visible", timeout=60000)
+                publishing_text = page.get_by_text("Publishing...")
+                await publishing_text.wait_for(state="visible", timeout=60000)
                 logger.info("Publishing in progress...")
-                await page.get_by_text("Publishing...").wait_for(state="hidden", timeout=PUBLISH_WAIT * 1000)
+                await expect(publishing_text).to_be_hidden(timeout=PUBLISH_WAIT * 1000)
                 logger.info("Publishing completed successfully.")
 
                 return {
@@ -203,10 +388,11 @@ class V0Automation:
                 }
 
             else:
-                await page.screenshot(path="publish_error_snapshot.png")
+                snapshot_path = await _save_error_screenshot(page, "v0_publish_error_")
                 return {
                     "status": "error",
-                    "error": "Could not find 'Publish Changes' or 'Update' in the publish dropdown. See publish_error_snapshot.png"
+                    "error": f"Could not find 'Publish Changes' or 'Update' in the publish dropdown. See {snapshot_path}",
+                    "screenshot_path": snapshot_path
                 }
 
         except Exception as e:
@@ -216,16 +402,18 @@ class V0Automation:
                 "error": str(e)
             }
         finally:
-            await page.close()
+            if owns_page:
+                await page.close()
 
-    async def view_app(self, context: BrowserContext, production_url: str, wait_seconds: int = VIEW_APP_WAIT) -> Dict[str, Any]:
+    async def view_app(self, context: BrowserContext, production_url: str, wait_seconds: int = 0) -> Dict[str, Any]:
         """
         Opens the production URL in a new tab.
 
         Args:
             context: Authenticated Playwright context
             production_url: URL to the production application
-            wait_seconds: How long to keep browser open (default: 60 seconds)
+            wait_seconds: How long to keep browser open after the page loads
+                          (default: 0, return as soon as the DOM is ready)
 
         Returns:
             Dict: Status of view operation
@@ -234,8 +422,12 @@ class V0Automation:
         try:
             logger.info(f"Opening production app at {production_url}...")
             await page.goto(production_url)
-            logger.info(f"App opened. Browser will remain open for {wait_seconds} seconds.")
-            await page.wait_for_timeout(wait_seconds * 1000)
+            await page.wait_for_load_state("domcontentloaded")
+            if wait_seconds > 0:
+                logger.info(f"App opened. Browser will remain open for {wait_seconds} seconds.")
+                await page.wait_for_timeout(wait_seconds * 1000)
+            else:
+                logger.info("App opened.")
 
             return {
                 "status": "success",
@@ -252,6 +444,48 @@ class V0Automation:
             await page.close()
 
 
+_storage_state_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+
+
+def _load_storage_state() -> Dict[str, Any]:
+    """Parsed STORAGE_STATE_PATH, re-read only when the file changes."""
+    global _storage_state_cache
+    mtime_ns = STORAGE_STATE_PATH.stat().st_mtime_ns
+    if _storage_state_cache is None or _storage_state_cache[0] != mtime_ns:
+        state = json.loads(STORAGE_STATE_PATH.read_bytes())
+        _storage_state_cache = (mtime_ns, state)
+    return _storage_state_cache[1]
+
+
+def _auth_error() -> Optional[Dict[str, Any]]:
+    """
+    Error dict if the saved auth state is missing or unreadable, else None.
+
+    Checked before touching the browser so a truncated or corrupt auth file
+    fails fast instead of after a Chromium launch.
+    """
+    try:
+        # One stat(); the parsed state is reused while the file is unchanged
+        _load_storage_state()
+    except FileNotFoundError:
+        return {"status": "error", "error": "Not authenticated. Run v0_login first."}
+    except (OSError, ValueError) as e:
+        logger.error(f"Saved auth state is unreadable: {e}")
+        return {"status": "error", "error": f"Saved auth state is unreadable ({e}). Run v0_login again."}
+    return None
+
+
+_automation: Optional[V0Automation] = None
+
+
+def _get_automation() -> V0Automation:
+    """Return the process-wide V0Automation used by the standalone functions."""
+    global _automation
+    if _automation is None:
+        _automation = V0Automation()
+    return _automation
+
+
 # Standalone functions for MCP tool wrapping
 async def v0_login() -> Dict[str, Any]:
     """
@@ -262,7 +496,7 @@ async def v0_login() -> Dict[str, Any]:
     Returns:
         Dict: Authentication status
     """
-    automation = V0Automation()
+    automation = _get_automation()
     return await automation.login_v0()
 
 
@@ -276,20 +510,15 @@ async def v0_git_pull(v0_chat_url: str) -> Dict[str, Any]:
     Returns:
         Dict: Git pull status
     """
-    automation = V0Automation()
+    automation = _get_automation()
 
-    if not STORAGE_STATE_PATH.exists():
-        return {"status": "error", "error": "Not authenticated. Run v0_login first."}
+    auth_error = _auth_error()
+    if auth_error:
+        return auth_error
 
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=False)
-            context = await browser.new_context(storage_state=str(STORAGE_STATE_PATH))
-
+        async with tool_context() as context:
             result = await automation.git_pull_changes(context, v0_chat_url)
-
-            await context.close()
-            await browser.close()
             return result
 
     except Exception as e:
@@ -307,20 +536,15 @@ async def v0_publish(v0_chat_url: str) -> Dict[str, Any]:
     Returns:
         Dict: Publish status
     """
-    automation = V0Automation()
+    automation = _get_automation()
 
-    if not STORAGE_STATE_PATH.exists():
-        return {"status": "error", "error": "Not authenticated. Run v0_login first."}
+    auth_error = _auth_error()
+    if auth_error:
+        return auth_error
 
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=False)
-            context = await browser.new_context(storage_state=str(STORAGE_STATE_PATH))
-
+        async with tool_context() as context:
             result = await automation.publish_changes(context, v0_chat_url)
-
-            await context.close()
-            await browser.close()
             return result
 
     except Exception as e:
@@ -339,20 +563,15 @@ async def v0_view_app(production_url: str, wait_seconds: int = VIEW_APP_WAIT) ->
     Returns:
         Dict: View status
     """
-    automation = V0Automation()
+    automation = _get_automation()
 
-    if not STORAGE_STATE_PATH.exists():
-        return {"status": "error", "error": "Not authenticated. Run v0_login first."}
+    auth_error = _auth_error()
+    if auth_error:
+        return auth_error
 
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=False)
-            context = await browser.new_context(storage_state=str(STORAGE_STATE_PATH))
-
+        async with tool_context() as context:
             result = await automation.view_app(context, production_url, wait_seconds)
-
-            await context.close()
-            await browser.close()
             return result
 
     except Exception as e:
@@ -372,47 +591,50 @@ async def v0_deploy(v0_chat_url: str, production_url: str, view: bool = False) -
     Returns:
         Dict: Combined deployment status
     """
-    automation = V0Automation()
+    automation = _get_automation()
 
-    if not STORAGE_STATE_PATH.exists():
-        return {"status": "error", "error": "Not authenticated. Run v0_login first."}
+    auth_error = _auth_error()
+    if auth_error:
+        return auth_error
 
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=False)
-            context = await browser.new_context(storage_state=str(STORAGE_STATE_PATH))
-
+        async with tool_context() as context:
             logger.info("--- Starting Deployment ---")
 
-            # Step 1: Pull changes
-            logger.info("\nStep 1: Pulling Git Changes...")
-            pull_result = await automation.git_pull_changes(context, v0_chat_url)
+            # Pull and publish act on the same project page; navigate once
+            page = await context.new_page()
+            try:
+                await _block_heavy_resources(page)
+                logger.info(f"Navigating to {v0_chat_url}...")
+                await page.goto(v0_chat_url)
 
-            if pull_result["status"] != "success":
-                await context.close()
-                await browser.close()
-                return pull_result
+                # Step 1: Pull changes
+                logger.info("\nStep 1: Pulling Git Changes...")
+                pull_result = await automation.git_pull_changes(context, v0_chat_url, page=page)
 
-            # Step 2: Publish
-            logger.info("\nStep 2: Publishing Changes...")
-            publish_result = await automation.publish_changes(context, v0_chat_url)
+                if pull_result["status"] != "success":
+                    return pull_result
 
-            if publish_result["status"] != "success":
-                await context.close()
-                await browser.close()
-                return publish_result
+                # Step 2: Publish
+                logger.info("\nStep 2: Publishing Changes...")
+                publish_result = await automation.publish_changes(context, v0_chat_url, page=page)
+
+                if publish_result["status"] != "success":
+                    return publish_result
+            finally:
+                await page.close()
 
             # Step 3: View app (optional)
             view_result = None
             if view:
                 logger.info("\nStep 3: Opening Production App...")
-                view_result = await automation.view_app(context, production_url)
+                # Nobody can watch a headless browser, so don't hold the result for the dwell
+                view_result = await automation.view_app(
+                    context, production_url, wait_seconds=0 if HEADLESS else VIEW_APP_WAIT
+                )
 
             logger.info("--- Deployment Finished ---")
 
-            await context.close()
-            await browser.close()
-
             return {
                 "status": "success",
                 "pull": pull_result,
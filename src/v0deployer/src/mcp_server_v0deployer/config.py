@@ -8,12 +8,30 @@ from pathlib import Path
 SCRIPT_DIR = Path(__file__).parent
 STORAGE_STATE_PATH = SCRIPT_DIR / "v0_auth_state.json"
 
+# Screenshots taken when a tool fails; only the newest SCREENSHOT_KEEP are kept
+SCREENSHOT_DIR = STORAGE_STATE_PATH.parent / "error_screenshots"
+SCREENSHOT_KEEP = 20
+
 # The config file for v0 deployment (v0_config.json)
 # Expected in the Current Working Directory when running
 CONFIG_PATH = Path.cwd() / "v0_config.json"
 
+# Root log level applied by the server entry point (e.g. DEBUG, INFO, WARNING)
+LOG_LEVEL = os.environ.get("V0_LOG_LEVEL", "INFO").upper()
+
+# Browser launch options for non-interactive tools (login is always headful)
+HEADLESS = os.environ.get("V0_HEADLESS", "true").lower() not in ("0", "false", "no")
+BROWSER_ARGS = ["--disable-dev-shm-usage"]
+
+# Optional persistent Chromium profile for non-interactive tools. When set, tools
+# share one launch_persistent_context (warm HTTP cache, no per-call storage_state
+# rehydration); cookies from STORAGE_STATE_PATH are imported on launch and again
+# whenever the file changes.
+_user_data_dir = os.environ.get("V0_USER_DATA_DIR")
+USER_DATA_DIR = Path(_user_data_dir).expanduser() if _user_data_dir else None
+
 # Timing patterns for v0.dev UI
-DROPDOWN_WAIT = 1  # Seconds - Wait for dropdown menus to appear
+DROPDOWN_TIMEOUT = 5  # Seconds - Upper bound for the Publish dropdown entries to appear
 SYNC_WAIT = 120  # Seconds - Wait for "Syncing Changes" to complete
 PUBLISH_WAIT = 180  # Seconds - Wait for "Publishing..." to complete
 VIEW_APP_WAIT = 60  # Seconds - Keep browser open when viewing app
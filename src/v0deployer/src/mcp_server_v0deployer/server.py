@@ -9,9 +9,10 @@ Provides tools, resources, and prompts for Vercel deployment workflows.
 """
 
 import asyncio
+import functools
 import logging
-from pathlib import Path
-from typing import Optional, Any
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 try:
     from mcp.server.fastmcp import FastMCP
@@ -24,15 +25,24 @@ from .automation import (
     v0_publish as do_v0_publish,
     v0_view_app as do_v0_view_app,
     v0_deploy as do_v0_deploy,
+    shutdown_browser,
 )
-from .config import DOCS_PATH
+from .config import DOCS_PATH, LOG_LEVEL, VIEW_APP_WAIT
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close the shared Playwright browser when the server shuts down."""
+    try:
+        yield
+    finally:
+        await shutdown_browser()
+
+
 # Create FastMCP server
-mcp = FastMCP(name="v0deployer")
+mcp = FastMCP(name="v0deployer", lifespan=lifespan)
 
 
 # ============================================================================
@@ -61,7 +71,7 @@ async def v0_publish(v0_chat_url: str) -> dict:
 
 
 @mcp.tool()
-async def v0_view_app(production_url: str, wait_seconds: int = 60) -> dict:
+async def v0_view_app(production_url: str, wait_seconds: int = VIEW_APP_WAIT) -> dict:
     """Open production application in browser for testing."""
     logger.info(f"Viewing app: {production_url}")
     return await do_v0_view_app(production_url, wait_seconds)
@@ -78,39 +88,47 @@ async def v0_deploy(v0_chat_url: str, production_url: str, view: bool = False) -
 # RESOURCES - Documentation accessible via MCP
 # ============================================================================
 
+# Documentation key -> filename under DOCS_PATH
+DOC_FILES = {
+    "deployment-workflow": "deployment-workflow.md",
+    "agent-collaboration": "agent-collaboration.md",
+    "build-integrity": "build-integrity.md",
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _read_doc_version(filename: str, mtime_ns: int) -> str:
+    """Read one version of a documentation file; mtime_ns keys the cache."""
+    return (DOCS_PATH / filename).read_text(encoding="utf-8")
+
+
+def _read_doc(filename: str) -> str:
+    """Read a documentation file, re-reading it only after it changes on disk."""
+    file_path = DOCS_PATH / filename
+    try:
+        mtime_ns = file_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Documentation file not found: {filename}") from None
+    return _read_doc_version(filename, mtime_ns)
+
+
 @mcp.resource("v0://docs/{doc_key}")
 async def get_documentation(doc_key: str) -> str:
     """Get v0 deployer documentation by key."""
-    doc_files = {
-        "deployment-workflow": "deployment-workflow.md",
-        "agent-collaboration": "agent-collaboration.md",
-        "build-integrity": "build-integrity.md",
-    }
-
-    filename = doc_files.get(doc_key)
+    filename = DOC_FILES.get(doc_key)
     if not filename:
         raise ValueError(f"Unknown document: {doc_key}")
 
-    file_path = DOCS_PATH / filename
-    if not file_path.exists():
-        raise FileNotFoundError(f"Documentation file not found: {filename}")
-
-    return file_path.read_text(encoding="utf-8")
+    # Stat/read off the event loop; cache hits return almost immediately
+    return await asyncio.to_thread(_read_doc, filename)
 
 
 # ============================================================================
 # PROMPTS - Pre-configured workflows
 # ============================================================================
 
-@mcp.prompt()
-async def deploy_to_vercel(
-    v0_chat_url: str,
-    production_url: str,
-    view_after_deploy: str = "false"
-) -> str:
-    """Complete deployment workflow for v0.dev to Vercel."""
-    view = view_after_deploy.lower() == "true"
-    return f"""# Deploy v0.dev Project to Vercel
+# Prompt bodies are built once at import and filled per call
+_DEPLOY_TO_VERCEL_PROMPT = """# Deploy v0.dev Project to Vercel
 
 ## Deployment Details
 **v0.dev Project**: {v0_chat_url}
@@ -129,17 +147,13 @@ Use `v0_publish` tool to commit and trigger Vercel deployment.
 Allow 15-20 seconds for Vercel deployment to complete.
 
 ### Step 4: Verify Deployment
-{"Use `v0_view_app` tool to test the production application." if view else "Optionally verify at " + production_url}
+{verify_step}
 
 ## Reference Documentation
 - Read v0://docs/deployment-workflow for detailed UI patterns
 """
 
-
-@mcp.prompt()
-async def troubleshoot_deployment(issue_description: str) -> str:
-    """Debug common v0.dev and Vercel deployment issues."""
-    return f"""# Troubleshoot v0.dev Deployment Issue
+_TROUBLESHOOT_DEPLOYMENT_PROMPT = """# Troubleshoot v0.dev Deployment Issue
 
 ## Issue Description
 {issue_description}
@@ -165,12 +179,42 @@ Read v0://docs/deployment-workflow to find matching issue:
 """
 
 
+@mcp.prompt()
+def deploy_to_vercel(
+    v0_chat_url: str,
+    production_url: str,
+    view_after_deploy: str = "false"
+) -> str:
+    """Complete deployment workflow for v0.dev to Vercel."""
+    view = view_after_deploy.lower() == "true"
+    if view:
+        verify_step = "Use `v0_view_app` tool to test the production application."
+    else:
+        verify_step = f"Optionally verify at {production_url}"
+    return _DEPLOY_TO_VERCEL_PROMPT.format(
+        v0_chat_url=v0_chat_url,
+        production_url=production_url,
+        view=view,
+        verify_step=verify_step
+    )
+
+
+@mcp.prompt()
+def troubleshoot_deployment(issue_description: str) -> str:
+    """Debug common v0.dev and Vercel deployment issues."""
+    return _TROUBLESHOOT_DEPLOYMENT_PROMPT.format(issue_description=issue_description)
+
+
 def main():
     """Main entry point for the server - this is a regular function, not async."""
-    logger.info("v0 Deployer MCP Server starting...")
-    logger.info("Available tools: v0_login, v0_git_pull, v0_publish, v0_view_app, v0_deploy")
-    logger.info("Available resources: Documentation via v0://docs/*")
-    logger.info("Available prompts: deploy-to-vercel, troubleshoot-deployment")
+    logging.basicConfig(level=LOG_LEVEL)
+    # One record for the whole banner
+    logger.info(
+        "v0 Deployer MCP Server starting...\n"
+        "Available tools: v0_login, v0_git_pull, v0_publish, v0_view_app, v0_deploy\n"
+        "Available resources: Documentation via v0://docs/*\n"
+        "Available prompts: deploy-to-vercel, troubleshoot-deployment"
+    )
     mcp.run()
 
 
@@ -0,0 +1,107 @@
+import asyncio
+import json
+import os
+from typing import cast
+
+import pytest
+from playwright.async_api import Page
+
+from mcp_server_v0deployer import automation
+
+
+@pytest.fixture
+def config_path(tmp_path, monkeypatch):
+    path = tmp_path / "v0_config.json"
+    monkeypatch.setattr(automation, "CONFIG_PATH", path)
+    monkeypatch.setattr(automation, "_config_cache", None)
+    return path
+
+
+@pytest.fixture
+def storage_state_path(tmp_path, monkeypatch):
+    path = tmp_path / "v0_auth_state.json"
+    monkeypatch.setattr(automation, "STORAGE_STATE_PATH", path)
+    monkeypatch.setattr(automation, "_storage_state_cache", None)
+    return path
+
+
+def rewrite_keeping_mtime(path, content):
+    mtime_ns = path.stat().st_mtime_ns
+    path.write_text(content, encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+    return mtime_ns
+
+
+def test_load_config_rereads_only_after_mtime_changes(config_path):
+    config_path.write_text(json.dumps({"project": "a"}), encoding="utf-8")
+    first = automation.load_config()
+    assert first == {"project": "a"}
+
+    mtime_ns = rewrite_keeping_mtime(config_path, json.dumps({"project": "b"}))
+    assert automation.load_config() is first
+
+    os.utime(config_path, ns=(mtime_ns + 1_000_000, mtime_ns + 1_000_000))
+    assert automation.load_config() == {"project": "b"}
+
+
+def test_load_config_missing_file(config_path):
+    with pytest.raises(FileNotFoundError, match="v0_config.json"):
+        automation.load_config()
+
+
+def test_load_storage_state_rereads_only_after_mtime_changes(storage_state_path):
+    storage_state_path.write_text(json.dumps({"cookies": [{"name": "a"}]}), encoding="utf-8")
+    first = automation._load_storage_state()
+
+    mtime_ns = rewrite_keeping_mtime(storage_state_path, json.dumps({"cookies": [{"name": "b"}]}))
+    assert automation._load_storage_state() is first
+
+    os.utime(storage_state_path, ns=(mtime_ns + 1_000_000, mtime_ns + 1_000_000))
+    assert automation._load_storage_state()["cookies"][0]["name"] == "b"
+
+
+def test_auth_error_missing_state(storage_state_path):
+    error = automation._auth_error()
+    assert error is not None
+    assert "v0_login" in error["error"]
+
+
+def test_auth_error_unreadable_state(storage_state_path):
+    storage_state_path.write_text("{truncated", encoding="utf-8")
+
+    error = automation._auth_error()
+    assert error is not None
+    assert error["status"] == "error"
+    assert "unreadable" in error["error"]
+
+
+def test_auth_error_valid_state(storage_state_path):
+    storage_state_path.write_text(json.dumps({"cookies": []}), encoding="utf-8")
+
+    assert automation._auth_error() is None
+
+
+class FakePage:
+    async def screenshot(self, path):
+        with open(path, "wb") as f:
+            f.write(b"png")
+
+
+def fake_page() -> Page:
+    return cast(Page, FakePage())
+
+
+def test_save_error_screenshot_prunes_old_files(tmp_path, monkeypatch):
+    screenshot_dir = tmp_path / "error_screenshots"
+    monkeypatch.setattr(automation, "SCREENSHOT_DIR", screenshot_dir)
+    monkeypatch.setattr(automation, "SCREENSHOT_KEEP", 2)
+
+    paths = []
+    for age in (30, 20, 10):
+        path = asyncio.run(automation._save_error_screenshot(fake_page(), "v0_publish_error_"))
+        mtime = os.path.getmtime(path) - age
+        os.utime(path, (mtime, mtime))
+        paths.append(path)
+    newest = asyncio.run(automation._save_error_screenshot(fake_page(), "v0_publish_error_"))
+
+    assert {str(path) for path in screenshot_dir.glob("*.png")} == {paths[2], newest}
@@ -0,0 +1,65 @@
+import asyncio
+import os
+
+import pytest
+
+from mcp_server_v0deployer import server
+
+
+@pytest.fixture
+def docs_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(server, "DOCS_PATH", tmp_path)
+    server._read_doc_version.cache_clear()
+    yield tmp_path
+    server._read_doc_version.cache_clear()
+
+
+def test_read_doc_caches_until_file_changes(docs_path):
+    doc = docs_path / "guide.md"
+    doc.write_text("v1", encoding="utf-8")
+    mtime_ns = doc.stat().st_mtime_ns
+
+    assert server._read_doc("guide.md") == "v1"
+
+    doc.write_text("v2", encoding="utf-8")
+    os.utime(doc, ns=(mtime_ns, mtime_ns))
+    assert server._read_doc("guide.md") == "v1"
+
+    os.utime(doc, ns=(mtime_ns + 1_000_000, mtime_ns + 1_000_000))
+    assert server._read_doc("guide.md") == "v2"
+
+
+def test_read_doc_missing_file(docs_path):
+    with pytest.raises(FileNotFoundError, match="missing.md"):
+        server._read_doc("missing.md")
+
+
+def test_get_documentation_unknown_key():
+    with pytest.raises(ValueError, match="Unknown document"):
+        asyncio.run(server.get_documentation("no-such-doc"))
+
+
+def test_doc_files_exist():
+    for filename in server.DOC_FILES.values():
+        assert (server.DOCS_PATH / filename).is_file(), filename
+
+
+@pytest.mark.parametrize("view_after_deploy, verify_step", [
+    ("true", "Use `v0_view_app` tool to test the production application."),
+    ("false", "Optionally verify at https://demo.vercel.app"),
+])
+def test_deploy_to_vercel_prompt(view_after_deploy, verify_step):
+    prompt = server.deploy_to_vercel("https://v0.app/chat/abc", "https://demo.vercel.app", view_after_deploy)
+
+    assert "**v0.dev Project**: https://v0.app/chat/abc" in prompt
+    assert "**Production URL**: https://demo.vercel.app" in prompt
+    assert f"**View After Deploy**: {view_after_deploy == 'true'}" in prompt
+    assert f"### Step 4: Verify Deployment\n{verify_step}\n" in prompt
+    assert "{" not in prompt
+
+
+def test_troubleshoot_deployment_prompt():
+    prompt = server.troubleshoot_deployment("Publish button missing")
+
+    assert "## Issue Description\nPublish button missing\n" in prompt
+    assert "{" not in prompt